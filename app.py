@@ -7,6 +7,9 @@ import os
 import plotly.express as px
 import plotly.graph_objects as go
 import datetime
+import urllib.parse
+import hashlib
+import math
 
 def style_chart(fig):
     fig.update_layout(
@@ -74,29 +77,22 @@ st.markdown("""
         font-size: 1.8em;
         font-weight: bold;
     }
-    .stTabs [data-baseweb="tab"] {
-        height: 50px;
+    .stRadio [role="radiogroup"] {
+        background-color: #FFFFFF;
+        padding: 10px 10px 0 10px;
+        border-radius: 10px 10px 0 0;
+        gap: 5px;
+    }
+    .stRadio [role="radiogroup"] label {
         padding: 15px 20px;
         background-color: #F8F9FA;
         border-radius: 5px 5px 0 0;
         font-weight: 500;
         color: #1E3D59;
     }
-    .stTabs [data-baseweb="tab"]:hover {
+    .stRadio [role="radiogroup"] label:hover {
         background-color: #E8EEF2;
     }
-    .stTabs [data-baseweb="tab-list"] {
-        background-color: #FFFFFF;
-        padding: 10px 10px 0 10px;
-        border-radius: 10px 10px 0 0;
-        gap: 5px;
-    }
-    .stTabs [data-baseweb="tab-panel"] {
-        background-color: #FFFFFF;
-        padding: 20px;
-        border-radius: 0 0 10px 10px;
-        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-    }
     .stDownloadButton button {
         background: linear-gradient(135deg, #17428D, #1E3D59);
         color: white;
@@ -141,8 +137,20 @@ st.markdown("""
     </div>
 """, unsafe_allow_html=True)
 
-@st.cache_data
-def load_data():
+def data_version():
+    # Hash the contents rather than the mtime so a redeploy or fresh clone of
+    # the same data still hits the results persisted by earlier runs.
+    for path in ("final.csv", "data/final.csv"):
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                return hashlib.sha256(f.read()).hexdigest()
+    return ""
+
+@st.cache_data(persist="disk")
+def load_data(version):
+    # `version` is only part of the cache key, so edits to final.csv are
+    # picked up without restarting the server and a restart with unchanged
+    # data skips parsing the CSV.
     try:
         
         df = pd.read_csv("final.csv")
@@ -177,7 +185,8 @@ def load_data():
         return pd.DataFrame(columns=['Name', 'Market Cap', 'Price'])
 
 try:
-    data = load_data().copy()
+    version = data_version()
+    data = load_data(version).copy()
     if data.empty:
         st.warning("No data available. Please check your data source.")
         st.stop()
@@ -185,57 +194,170 @@ except Exception as e:
     st.error(f"Failed to process data: {e}")
     st.stop()
 
+SORT_OPTIONS = {
+    "cap_desc": ("Market Cap (High to Low)", 'Market Cap', False),
+    "cap_asc": ("Market Cap (Low to High)", 'Market Cap', True),
+    "price_desc": ("Price (High to Low)", 'Price', False),
+    "price_asc": ("Price (Low to High)", 'Price', True),
+    "name_asc": ("Company Name (A-Z)", 'Name', True)
+}
+SORT_LABELS = {slug: label for slug, (label, _, _) in SORT_OPTIONS.items()}
+SORT_SLUGS = {label: slug for slug, label in SORT_LABELS.items()}
+
+TABS = {
+    "rankings": "📊 Rankings",
+    "market": "📈 Market Analysis",
+    "price": "💰 Price Analysis",
+    "insights": "🔍 Insights"
+}
+TAB_SLUGS = {label: slug for slug, label in TABS.items()}
+
+DEFAULT_NUMBER_OF_COMPANIES = 25
+PERSISTED_COMPANY_COUNTS = ("10", "25", "50")
+
+def format_number(value):
+    return ('%.2f' % value).rstrip('0').rstrip('.')
+
+def parse_float(value, default, low, high):
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        return default
+    if not math.isfinite(value):
+        return default
+    return min(max(round(value, 2), low), high)
+
+def parse_view(params, df):
+    # Unknown or malformed query values fall back to the default view.
+    cap_bounds = (float(df['Market Cap'].min()), float(df['Market Cap'].max()))
+    price_bounds = (float(df['Price'].min()), float(df['Price'].max()))
+    max_companies = max(len(df), 5)
+
+    try:
+        number_of_companies = min(max(int(params.get("n")), 5), max_companies)
+    except (TypeError, ValueError):
+        number_of_companies = min(DEFAULT_NUMBER_OF_COMPANIES, max_companies)
+
+    cap_min = parse_float(params.get("cap_min"), cap_bounds[0], *cap_bounds)
+    cap_max = parse_float(params.get("cap_max"), cap_bounds[1], cap_min, cap_bounds[1])
+    price_min = parse_float(params.get("price_min"), price_bounds[0], *price_bounds)
+    price_max = parse_float(params.get("price_max"), price_bounds[1], price_min, price_bounds[1])
+
+    return {
+        "number_of_companies": number_of_companies,
+        "market_cap_range": (cap_min, cap_max),
+        "price_range": (price_min, price_max),
+        "search_term": params.get("q") or "",
+        "sort_by": SORT_LABELS.get(params.get("sort"), SORT_LABELS["cap_desc"]),
+        "active_tab": TABS.get(params.get("tab"), TABS["rankings"])
+    }
+
+def canonical_view(view, df):
+    # Only values that differ from the default view are kept, so equivalent
+    # links collapse onto the same query string and cache entry.
+    defaults = parse_view({}, df)
+    params = {}
+    if view["number_of_companies"] != defaults["number_of_companies"]:
+        params["n"] = str(view["number_of_companies"])
+    for prefix, key in (("cap", "market_cap_range"), ("price", "price_range")):
+        low, high = view[key]
+        if round(low, 2) > round(defaults[key][0], 2):
+            params[f"{prefix}_min"] = format_number(low)
+        if round(high, 2) < round(defaults[key][1], 2):
+            params[f"{prefix}_max"] = format_number(high)
+    if view["search_term"].strip():
+        params["q"] = view["search_term"].strip()
+    if view["sort_by"] != defaults["sort_by"]:
+        params["sort"] = SORT_SLUGS[view["sort_by"]]
+    if view["active_tab"] != defaults["active_tab"]:
+        params["tab"] = TAB_SLUGS[view["active_tab"]]
+    return params
+
+def view_key(params):
+    # The active tab only changes what is rendered, not the filtered result.
+    return urllib.parse.urlencode(sorted((k, v) for k, v in params.items() if k != "tab"))
+
+def is_popular_view(key):
+    # Only the default view and its sort/preset-n variants are persisted, at
+    # most 15 entries per data version; free-text searches and arbitrary
+    # ranges would otherwise leave a new file on disk for every distinct link.
+    return all(
+        name == "sort" or (name == "n" and value in PERSISTED_COMPANY_COUNTS)
+        for name, value in urllib.parse.parse_qsl(key)
+    )
+
+def filter_view(df, key):
+    view = parse_view(dict(urllib.parse.parse_qsl(key)), df)
+
+    result = df[
+        (df['Market Cap'].between(*view["market_cap_range"])) &
+        (df['Price'].between(*view["price_range"]))
+    ]
+
+    if view["search_term"]:
+        result = result[result['Name'].str.contains(view["search_term"], case=False, regex=False)]
+
+    _, sort_col, sort_asc = SORT_OPTIONS[SORT_SLUGS[view["sort_by"]]]
+    result = result.sort_values(sort_col, ascending=sort_asc)
+    return result.head(view["number_of_companies"])
+
+@st.cache_data(persist="disk", show_spinner=False)
+def load_popular_view(key, version):
+    return filter_view(load_data(version), key)
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def load_custom_view(key, version):
+    return filter_view(load_data(version), key)
+
+def load_view(key, version):
+    if is_popular_view(key):
+        return load_popular_view(key, version)
+    return load_custom_view(key, version)
+
+if "view_restored" not in st.session_state:
+    st.session_state.update(parse_view(st.query_params, data))
+    st.session_state["view_restored"] = True
+
 st.sidebar.markdown("## 🔍 Filter Options")
 st.sidebar.markdown("---")
 
 with st.sidebar:
    
-    number_of_companies = st.slider("Number of Companies to Display", 5, len(data), 25)
+    st.slider("Number of Companies to Display", 5, max(len(data), 5), key="number_of_companies")
     
     st.markdown("### 💰 Market Cap Filter (Billion USD)")
-    market_cap_range = st.slider(
+    st.slider(
         "Select Range",
         float(data['Market Cap'].min()),
         float(data['Market Cap'].max()),
-        (float(data['Market Cap'].min()), float(data['Market Cap'].max()))
+        key="market_cap_range"
     )
     
     st.markdown("### 💵 Stock Price Filter (USD)")
-    price_range = st.slider(
+    st.slider(
         "Select Range",
         float(data['Price'].min()),
         float(data['Price'].max()),
-        (float(data['Price'].min()), float(data['Price'].max()))
+        key="price_range"
     )
     
-    search_term = st.text_input("🔍 Search Company")
+    st.text_input("🔍 Search Company", key="search_term")
     
     st.markdown("### 📊 Sort By")
-    sort_by = st.selectbox(
-        "Order",
-        ["Market Cap (High to Low)", "Market Cap (Low to High)", 
-         "Price (High to Low)", "Price (Low to High)", 
-         "Company Name (A-Z)"]
-    )
-
-filtered_data = data[
-    (data['Market Cap'].between(market_cap_range[0], market_cap_range[1])) &
-    (data['Price'].between(price_range[0], price_range[1]))
-]
+    st.selectbox("Order", list(SORT_LABELS.values()), key="sort_by")
 
-if search_term:
-    filtered_data = filtered_data[filtered_data['Name'].str.contains(search_term, case=False)]
+view_params = canonical_view(
+    {name: st.session_state[name] for name in parse_view({}, data)},
+    data
+)
+if st.query_params.to_dict() != view_params:
+    st.query_params.clear()
+    st.query_params.update(view_params)
 
-sort_dict = {
-    "Market Cap (High to Low)": ('Market Cap', False),
-    "Market Cap (Low to High)": ('Market Cap', True),
-    "Price (High to Low)": ('Price', False),
-    "Price (Low to High)": ('Price', True),
-    "Company Name (A-Z)": ('Name', True)
-}
-sort_col, sort_asc = sort_dict[sort_by]
-filtered_data = filtered_data.sort_values(sort_col, ascending=sort_asc)
-filtered_data = filtered_data.head(number_of_companies)
+filtered_data = load_view(view_key(view_params), version).copy()
+if filtered_data.empty:
+    st.info("No companies match these filters")
+    st.stop()
 
 col1, col2, col3, col4 = st.columns(4)
 with col1:
@@ -269,9 +391,9 @@ with col4:
 
 st.markdown("---")
 
-tab1, tab2, tab3, tab4 = st.tabs(["📊 Rankings", "📈 Market Analysis", "💰 Price Analysis", "🔍 Insights"])
+active_tab = st.radio("View", list(TABS.values()), key="active_tab", horizontal=True, label_visibility="collapsed")
 
-with tab1:
+def render_rankings():
    
     st.markdown("### 🏢 Company Rankings")
     
@@ -300,7 +422,7 @@ with tab1:
         height=400
     )
 
-with tab2:
+def render_market():
    
     st.markdown("""
         <div style='background: linear-gradient(135deg, #1E3D59, #17428D); 
@@ -523,7 +645,7 @@ with tab2:
         </div>
     """, unsafe_allow_html=True)
 
-with tab3:
+def render_price():
     col1, col2 = st.columns(2)
     
     with col1:
@@ -550,7 +672,7 @@ with tab3:
         fig_box.update_layout(height=500, title_x=0.5)
         st.plotly_chart(fig_box, use_container_width=True)
 
-with tab4:
+def render_insights():
   
     st.markdown("""
         <div style='background-color: #1E3D59; padding: 20px; border-radius: 10px; margin-bottom: 20px;'>
@@ -641,6 +763,16 @@ with tab4:
         </div>
     """, unsafe_allow_html=True)
 
+VIEW_RENDERERS = {
+    "rankings": render_rankings,
+    "market": render_market,
+    "price": render_price,
+    "insights": render_insights
+}
+
+with st.container(border=True):
+    VIEW_RENDERERS[TAB_SLUGS[active_tab]]()
+
 st.markdown("---")
 col1, col2, col3 = st.columns([1, 2, 1])
 with col2: